@@ -3,10 +3,14 @@
 # I have not tested that. Programmed on/for MacOS via Python3+
 
 import csv
+import mmap
 import os
 import sys
+import threading
 import webbrowser
 import tkinter as tk
+from collections import defaultdict
+from itertools import chain
 from tkinter import ttk, messagebox, filedialog
 from urllib.parse import quote_plus
 
@@ -39,32 +43,138 @@ PALETTES = {
     },
 }
 
+def _theme_settings(pal: dict, sysfont: tuple):
+    """All ttk style settings for one palette, in theme_create() format.
+
+    Mirrors what used to be ~20 imperative configure/map calls so both
+    palettes can be registered as named themes once at startup.
+    """
+    return {
+        ".": {"configure": {"font": sysfont}},
+        # ---- Notebook container ----
+        "TNotebook": {"configure": {
+            "background": pal["accent"],
+            "foreground": pal["text"],
+            "borderwidth": 0,
+            "padding": 0,
+        }},
+        # ---- Segmented tabbar buttons (this is used as visible tabs) ----
+        # Using ttk.Radiobutton with "Toolbutton" style
+        "Toolbutton": {
+            "configure": {
+                "background": pal["accent"],
+                "foreground": pal["text"],
+                "padding": (14, 8),
+                "borderwidth": 0,
+                "focusthickness": 0,
+                "focuscolor": pal["accent"],
+            },
+            "map": {
+                "background": [("selected", pal["panel"]), ("active", pal["panel"])],
+                "foreground": [("selected", pal["text"]), ("!selected", pal["text"])],
+                "relief": [("selected", "flat"), ("!selected", "flat")],
+            },
+        },
+        # ---- Frames / labels ----
+        "Modern.TFrame": {"configure": {"background": pal["panel"]}},
+        "Modern.TLabelframe": {"configure": {"background": pal["panel"]}},
+        "Modern.TLabelframe.Label": {"configure": {
+            "background": pal["panel"], "foreground": pal["text"],
+        }},
+        "Modern.TLabel": {"configure": {
+            "background": pal["panel"], "foreground": pal["text"],
+        }},
+        "Muted.TLabel": {"configure": {
+            "background": pal["panel"], "foreground": pal["text_mute"],
+        }},
+        # ---- Entry ----
+        "TEntry": {"configure": {"insertcolor": pal["text"]}},
+        "TSpinbox": {"configure": {"insertcolor": pal["text"]}},
+        "Modern.TEntry": {"configure": {
+            "fieldbackground": pal["panel"],
+            "background": pal["panel"],
+            "foreground": pal["text"],
+            "bordercolor": pal["muted"],
+            "lightcolor": pal["brand"],
+            "darkcolor": pal["muted"],
+            "insertcolor": pal["text"],
+            "padding": 8,
+        }},
+        # ---- Button ----
+        "Modern.TButton": {
+            "configure": {
+                "background": pal["panel"],
+                "foreground": pal["text"],
+                "padding": (12, 8),
+                "borderwidth": 0,
+            },
+            "map": {
+                "background": [("active", pal["accent"]), ("pressed", pal["accent"])],
+                "foreground": [("disabled", pal["text_mute"])],
+                "relief": [("pressed", "flat"), ("!pressed", "flat")],
+            },
+        },
+        # ---- Treeview ----
+        "Modern.Treeview": {"configure": {
+            "background": pal["panel"],
+            "fieldbackground": pal["panel"],
+            "foreground": pal["text"],
+            "bordercolor": pal["panel"],
+            "rowheight": 26,
+        }},
+        "Modern.Treeview.Heading": {
+            "configure": {
+                "background": pal["accent"],
+                "foreground": pal["text"],
+                "relief": "flat",
+                "padding": (10, 8),
+                "font": (sysfont[0], 11, "bold"),
+            },
+            "map": {"background": [("active", pal["panel"])]},
+        },
+        # Misc
+        "TSeparator": {"configure": {"background": pal["muted"]}},
+        "Vertical.TScrollbar": {"configure": {"background": pal["accent"]}},
+        "Horizontal.TScrollbar": {"configure": {"background": pal["accent"]}},
+    }
+
+
 def apply_modern_style(root: tk.Misc, mode: str = "dark"):
     """
     Apply a modern ttk theme that works on macOS/Windows/Linux and keeps:
       - Tab labels visible (we'll draw our own segmented tabbar)
       - Text caret visible in entries/text widgets
+
+    Both palettes are registered as named ttk themes ("bs-dark"/"bs-light")
+    on first call; after that a flip is a single theme_use swap instead of
+    re-issuing every configure/map.
     """
     pal = PALETTES["dark"] if mode == "dark" else PALETTES["light"]
 
     style = ttk.Style(root)
     # Styleable base: 'alt' on macOS, 'clam' elsewhere.
+    parent = "alt" if sys.platform == "darwin" else "clam"
+    sysfont = (".AppleSystemUIFont", 12) if sys.platform == "darwin" else ("Segoe UI", 10)
+
+    existing = style.theme_names()
+    for name, p in (("bs-dark", PALETTES["dark"]), ("bs-light", PALETTES["light"])):
+        if name not in existing:
+            try:
+                style.theme_create(name, parent=parent, settings=_theme_settings(p, sysfont))
+            except tk.TclError:
+                pass
+
     try:
-        style.theme_use("alt" if sys.platform == "darwin" else "clam")
+        style.theme_use("bs-dark" if mode == "dark" else "bs-light")
     except tk.TclError:
         pass
 
-    # System font
-    sysfont = (".AppleSystemUIFont", 12) if sys.platform == "darwin" else ("Segoe UI", 10)
-
     # Window bg
     try:
         root.configure(bg=pal["bg"])
     except tk.TclError:
         pass
 
-    style.configure(".", font=sysfont)
-
     # --- Caret visibility (re-apply on every theme flip)  ---
     # Sidenote: This was the most annoying part of this entire program
     for opt in (
@@ -75,97 +185,6 @@ def apply_modern_style(root: tk.Misc, mode: str = "dark"):
     for opt in ("*insertWidth", "*Entry.insertWidth", "*TEntry*insertWidth"):
         root.option_add(opt, 2)
 
-    # ---- Notebook container  ----
-    style.configure(
-        "TNotebook",
-        background=pal["accent"],
-        foreground=pal["text"],
-        borderwidth=0,
-        padding=0,
-    )
-
-    # ---- Segmented tabbar buttons (this is used as visible tabs) ----
-    # Using ttk.Radiobutton with "Toolbutton" style
-    style.configure(
-        "Toolbutton",
-        background=pal["accent"],
-        foreground=pal["text"],
-        padding=(14, 8),
-        borderwidth=0,
-        focusthickness=0,
-        focuscolor=pal["accent"],
-    )
-    style.map(
-        "Toolbutton",
-        background=[("selected", pal["panel"]), ("active", pal["panel"])],
-        foreground=[("selected", pal["text"]), ("!selected", pal["text"])],
-        relief=[("selected", "flat"), ("!selected", "flat")],
-    )
-
-    # ---- Frames / labels ----
-    style.configure("Modern.TFrame", background=pal["panel"])
-    style.configure("Modern.TLabelframe", background=pal["panel"])
-    style.configure("Modern.TLabelframe.Label", background=pal["panel"], foreground=pal["text"])
-    style.configure("Modern.TLabel", background=pal["panel"], foreground=pal["text"])
-    style.configure("Muted.TLabel", background=pal["panel"], foreground=pal["text_mute"])
-    try:
-        style.configure("TEntry", insertcolor=pal["text"])
-        style.configure("Modern.TEntry", insertcolor=pal["text"])
-        style.configure("TSpinbox", insertcolor=pal["text"])
-    except tk.TclError:
-        pass
-
-    # ---- Entry ----
-    style.configure(
-        "Modern.TEntry",
-        fieldbackground=pal["panel"],
-        background=pal["panel"],
-        foreground=pal["text"],
-        bordercolor=pal["muted"],
-        lightcolor=pal["brand"],
-        darkcolor=pal["muted"],
-        padding=8,
-    )
-
-    # ---- Button ----
-    style.configure(
-        "Modern.TButton",
-        background=pal["panel"],
-        foreground=pal["text"],
-        padding=(12, 8),
-        borderwidth=0,
-    )
-    style.map(
-        "Modern.TButton",
-        background=[("active", pal["accent"]), ("pressed", pal["accent"])],
-        foreground=[("disabled", pal["text_mute"])],
-        relief=[("pressed", "flat"), ("!pressed", "flat")],
-    )
-
-    # ---- Treeview ----
-    style.configure(
-        "Modern.Treeview",
-        background=pal["panel"],
-        fieldbackground=pal["panel"],
-        foreground=pal["text"],
-        bordercolor=pal["panel"],
-        rowheight=26,
-    )
-    style.configure(
-        "Modern.Treeview.Heading",
-        background=pal["accent"],
-        foreground=pal["text"],
-        relief="flat",
-        padding=(10, 8),
-        font=(sysfont[0], 11, "bold"),
-    )
-    style.map("Modern.Treeview.Heading", background=[("active", pal["panel"])])
-
-    # Misc
-    style.configure("TSeparator", background=pal["muted"])
-    style.configure("Vertical.TScrollbar", background=pal["accent"])
-    style.configure("Horizontal.TScrollbar", background=pal["accent"])
-
 # ---------------------------
 # Data loading
 # ---------------------------
@@ -176,22 +195,27 @@ def load_books(path: str):
     Return: list[dict]
     """
     books = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.rstrip("\n\r")
-            if not line:
-                continue
-            parts = line.split("\t")
-            if len(parts) < 4:
+    with open(path, "rb") as f:
+        # Map the file instead of reading it through the io layer's line
+        # buffer; lines are decoded lazily straight off the mapping.
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # zero-length file can't be mapped
+            return books
+        lines = (raw.decode("utf-8") for raw in iter(mapped.readline, b""))
+        # csv.reader splits in C; some rows have padded fields, so keep the strips.
+        for row in csv.reader(lines, delimiter="\t", quoting=csv.QUOTE_NONE):
+            if len(row) < 4:
                 continue
-            title, author, publisher, date = parts[0], parts[1], parts[2], parts[3]
+            title, author, publisher, date = row[0], row[1], row[2], row[3]
             try:
-                mm, dd, yyyy = date.split("/")
+                s1 = date.index("/")
+                s2 = date.index("/", s1 + 1)
                 books.append({
                     "title": title.strip(),
                     "author": author.strip(),
                     "publisher": publisher.strip(),
-                    "month": int(mm), "day": int(dd), "year": int(yyyy),
+                    "month": int(date[:s1]), "day": int(date[s1 + 1:s2]), "year": int(date[s2 + 1:]),
                 })
             except Exception:
                 continue
@@ -223,7 +247,21 @@ class BestsellerApp(tk.Tk):
                 self.books_all = load_books(self.data_path)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load file:\n{e}")
-        self.books_display = list(self.books_all)
+        self._build_columns()
+        # None is a sentinel for "all rows" — no need to copy or even
+        # enumerate the full index list just to show everything.
+        self.filtered_idx = None
+
+        # Debounce handle for live search (see _on_live_search)
+        self._search_after_id = None
+        # Last applied filter, as a (kind, *params) key — lets every search
+        # handler skip both the scan and the repaint when re-submitted.
+        self._last_filter_key = ("live", "")
+
+        # Lazy tree population state (see _refresh_tree)
+        self._fill_after_id = None
+        self._fill_indices = []
+        self._fill_pos = 0
 
         # Layout grid
         self.grid_columnconfigure(0, weight=1)
@@ -235,7 +273,38 @@ class BestsellerApp(tk.Tk):
         self._build_tabs()
         self._build_results()
         self._build_footer()
-        self._refresh_tree(self.books_display)
+        self._configure_stripe_colors()
+        self._refresh_tree(self.filtered_idx)
+
+    def _build_columns(self):
+        # Column-oriented views of books_all, rebuilt whenever it changes,
+        # so the queries never chase a dict per row.
+        books = self.books_all
+        # Lowercased text columns so queries don't re-lower every string
+        # on every keystroke.
+        self.titles_lc     = [b["title"].lower()     for b in books]
+        self.authors_lc    = [b["author"].lower()    for b in books]
+        self.publishers_lc = [b["publisher"].lower() for b in books]
+        # One searchable string per row for live search: a single substring
+        # scan replaces six per-field checks. \x1f keeps a query from
+        # matching across field boundaries.
+        self.haystacks = [
+            f"{t}\x1f{a}\x1f{p}\x1f{b['year']} {b['month']} {b['day']}"
+            for t, a, p, b in zip(self.titles_lc, self.authors_lc, self.publishers_lc, books)
+        ]
+        # Inverted date indexes: the year window is fixed (1942-2013), so a
+        # range query is a union of at most ~72 bucket lists, no scan.
+        self.by_year = defaultdict(list)
+        self.by_year_month = defaultdict(list)
+        for i, b in enumerate(books):
+            self.by_year[b["year"]].append(i)
+            self.by_year_month[(b["year"], b["month"])].append(i)
+        # Treeview values, built once: refreshes hand ready-made tuples to
+        # Tcl instead of doing six dict lookups per row each time.
+        self.row_tuples = [
+            (b["title"], b["author"], b["publisher"], b["month"], b["day"], b["year"])
+            for b in books
+        ]
 
     # ----- Header -----
     def _build_header(self, path_label: str):
@@ -246,14 +315,16 @@ class BestsellerApp(tk.Tk):
         # Left meta
         meta = ttk.Frame(hdr, style="Modern.TFrame")
         meta.grid(row=0, column=0, sticky="w")
-        ttk.Label(meta, text=f"Loaded {len(self.books_all)} books", style="Modern.TLabel").grid(row=0, column=0, sticky="w")
+        self._count_lbl = ttk.Label(meta, text=f"Loaded {len(self.books_all)} books", style="Modern.TLabel")
+        self._count_lbl.grid(row=0, column=0, sticky="w")
 
         # Live search
+        # Entries are read with .get() directly — no StringVar, so no Tcl
+        # trace fires on every keystroke before the debounce even runs.
         ttk.Label(hdr, text="Live search:", style="Muted.TLabel").grid(row=1, column=0, sticky="w", pady=(10, 0))
-        self.live_q = tk.StringVar()
-        e = ttk.Entry(hdr, textvariable=self.live_q, width=46, style="Modern.TEntry")
-        e.grid(row=1, column=1, sticky="ew", padx=(8, 0), pady=(10, 0))
-        e.bind("<KeyRelease>", self._on_live_search)
+        self.live_entry = ttk.Entry(hdr, width=46, style="Modern.TEntry")
+        self.live_entry.grid(row=1, column=1, sticky="ew", padx=(8, 0), pady=(10, 0))
+        self.live_entry.bind("<KeyRelease>", self._on_live_search)
 
         # Right actions
         act = ttk.Frame(hdr, style="Modern.TFrame")
@@ -265,7 +336,8 @@ class BestsellerApp(tk.Tk):
         ttk.Button(act, text="Clear", style="Modern.TButton", command=self.clear_results).grid(row=0, column=2, padx=(0, 8))
         ttk.Button(act, text="Export CSV", style="Modern.TButton", command=self.export_csv).grid(row=0, column=3)
 
-        ttk.Label(hdr, text=path_label, style="Muted.TLabel").grid(row=0, column=1, sticky="e")
+        self._path_lbl = ttk.Label(hdr, text=path_label, style="Muted.TLabel")
+        self._path_lbl.grid(row=0, column=1, sticky="e")
 
     # ----- Tabs -----
     def _build_tabs(self):
@@ -282,9 +354,10 @@ class BestsellerApp(tk.Tk):
         nb.add(t1, text="Between Years")
         ttk.Label(t1, text=f"Start year ({YEAR_MIN}-{YEAR_MAX})", style="Muted.TLabel").grid(row=0, column=0, sticky="w", padx=(0,8), pady=(2,4))
         ttk.Label(t1, text=f"End year ({YEAR_MIN}-{YEAR_MAX})",   style="Muted.TLabel").grid(row=0, column=1, sticky="w", padx=(0,8), pady=(2,4))
-        self.start_year = tk.StringVar(); self.end_year = tk.StringVar()
-        ttk.Entry(t1, textvariable=self.start_year, width=12, style="Modern.TEntry").grid(row=1, column=0, padx=(0,8), pady=(0,6))
-        ttk.Entry(t1, textvariable=self.end_year,   width=12, style="Modern.TEntry").grid(row=1, column=1, padx=(0,8), pady=(0,6))
+        self.start_year_entry = ttk.Entry(t1, width=12, style="Modern.TEntry")
+        self.start_year_entry.grid(row=1, column=0, padx=(0,8), pady=(0,6))
+        self.end_year_entry = ttk.Entry(t1, width=12, style="Modern.TEntry")
+        self.end_year_entry.grid(row=1, column=1, padx=(0,8), pady=(0,6))
         ttk.Button(t1, text="Search", style="Modern.TButton", command=self.search_year_range).grid(row=1, column=2, padx=(4,0), pady=(0,6))
         t1.grid_columnconfigure(3, weight=1)
 
@@ -293,9 +366,10 @@ class BestsellerApp(tk.Tk):
         nb.add(t2, text="Month & Year")
         ttk.Label(t2, text="Month (1–12)", style="Muted.TLabel").grid(row=0, column=0, sticky="w", padx=(0,8), pady=(2,4))
         ttk.Label(t2, text=f"Year ({YEAR_MIN}-{YEAR_MAX})", style="Muted.TLabel").grid(row=0, column=1, sticky="w", padx=(0,8), pady=(2,4))
-        self.month_val = tk.StringVar(); self.year_val  = tk.StringVar()
-        ttk.Entry(t2, textvariable=self.month_val, width=12, style="Modern.TEntry").grid(row=1, column=0, padx=(0,8), pady=(0,6))
-        ttk.Entry(t2, textvariable=self.year_val,  width=12, style="Modern.TEntry").grid(row=1, column=1, padx=(0,8), pady=(0,6))
+        self.month_entry = ttk.Entry(t2, width=12, style="Modern.TEntry")
+        self.month_entry.grid(row=1, column=0, padx=(0,8), pady=(0,6))
+        self.year_entry = ttk.Entry(t2, width=12, style="Modern.TEntry")
+        self.year_entry.grid(row=1, column=1, padx=(0,8), pady=(0,6))
         ttk.Button(t2, text="Search", style="Modern.TButton", command=self.search_month_year).grid(row=1, column=2, padx=(4,0), pady=(0,6))
         t2.grid_columnconfigure(3, weight=1)
 
@@ -303,8 +377,8 @@ class BestsellerApp(tk.Tk):
         t3 = ttk.Frame(nb, style="Modern.TFrame", padding=8)
         nb.add(t3, text="Author")
         ttk.Label(t3, text="Author contains", style="Muted.TLabel").grid(row=0, column=0, sticky="w", padx=(0,8), pady=(2,4))
-        self.author_q = tk.StringVar()
-        ttk.Entry(t3, textvariable=self.author_q, width=42, style="Modern.TEntry").grid(row=1, column=0, padx=(0,8), pady=(0,6))
+        self.author_entry = ttk.Entry(t3, width=42, style="Modern.TEntry")
+        self.author_entry.grid(row=1, column=0, padx=(0,8), pady=(0,6))
         ttk.Button(t3, text="Search", style="Modern.TButton", command=self.search_author).grid(row=1, column=1, padx=(4,0), pady=(0,6))
         t3.grid_columnconfigure(2, weight=1)
 
@@ -312,8 +386,8 @@ class BestsellerApp(tk.Tk):
         t4 = ttk.Frame(nb, style="Modern.TFrame", padding=8)
         nb.add(t4, text="Title")
         ttk.Label(t4, text="Title contains", style="Muted.TLabel").grid(row=0, column=0, sticky="w", padx=(0,8), pady=(2,4))
-        self.title_q = tk.StringVar()
-        ttk.Entry(t4, textvariable=self.title_q, width=42, style="Modern.TEntry").grid(row=1, column=0, padx=(0,8), pady=(0,6))
+        self.title_entry = ttk.Entry(t4, width=42, style="Modern.TEntry")
+        self.title_entry.grid(row=1, column=0, padx=(0,8), pady=(0,6))
         ttk.Button(t4, text="Search", style="Modern.TButton", command=self.search_title).grid(row=1, column=1, padx=(4,0), pady=(0,6))
         t4.grid_columnconfigure(2, weight=1)
 
@@ -325,6 +399,7 @@ class BestsellerApp(tk.Tk):
         panel.grid_columnconfigure(0, weight=1)
 
         cols = ("title", "author", "publisher", "month", "day", "year")
+        self._columns = cols
         self.tree = ttk.Treeview(panel, columns=cols, show="headings", style="Modern.Treeview")
         for c in cols:
             self.tree.heading(c, text=c.title(), command=lambda col=c: self._sort_by(col, False))
@@ -332,7 +407,8 @@ class BestsellerApp(tk.Tk):
             self.tree.column(c, width=width, anchor="w", stretch=True)
 
         vsb = ttk.Scrollbar(panel, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
+        self._vsb = vsb
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
         self.tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
 
@@ -413,7 +489,7 @@ class BestsellerApp(tk.Tk):
         apply_modern_style(self, mode=self.current_theme)
         self._sync_theme_button()
         if hasattr(self, "tree"):
-            self._apply_tree_stripes()  # update zebra colors
+            self._configure_stripe_colors()  # update zebra colors
 
     def _open_file(self):
         sel = filedialog.askopenfilename(
@@ -425,41 +501,83 @@ class BestsellerApp(tk.Tk):
         try:
             self.data_path = sel
             self.books_all = load_books(sel)
-            self.clear_results()
-            self._refresh_tree(self.books_all)
+            self._build_columns()
+            self.clear_results()  # also refreshes the tree
             self._relabel_header()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load file:\n{e}")
 
     def _relabel_header(self):
-        # Quick refresh of header with new filename/count
-        for child in self.grid_slaves(row=0, column=0):
-            child.destroy()
+        # Update the header labels in place; rebuilding the whole header
+        # would leak Tcl commands and re-register every binding.
         file_label = os.path.basename(self.data_path) if self.data_path else "(no file)"
-        self._build_header(file_label)
+        self._count_lbl.config(text=f"Loaded {len(self.books_all)} books")
+        self._path_lbl.config(text=file_label)
 
     def _clear_tree(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # One Tcl call instead of a per-item Python loop
+        self.tree.delete(*self.tree.get_children(""))
 
-    def _apply_tree_stripes(self):
+    def _configure_stripe_colors(self):
+        # Rows get their final odd/even tag at insert time, so a theme flip
+        # only needs to repoint the two tag colors — no re-tag walk.
         pal = PALETTES[self.current_theme]
         self.tree.tag_configure("even", background=pal["panel"])
         self.tree.tag_configure("odd",  background=pal["row_alt"])
-        for i, iid in enumerate(self.tree.get_children("")):
-            self.tree.item(iid, tags=("odd" if i % 2 else "even",))
 
-    def _refresh_tree(self, items):
+    # Rows are populated lazily: only about a screenful is inserted
+    # synchronously, the rest stream in via after() chunks (or on demand
+    # when the user scrolls near the bottom). Refresh latency therefore
+    # tracks the viewport, not the dataset.
+    _FIRST_FILL = 100
+    _FILL_CHUNK = 400
+
+    def _refresh_tree(self, indices):
+        """Repopulate the tree with the rows named by `indices` (row ids
+        into books_all / row_tuples; None means all rows)."""
+        if indices is None:
+            indices = range(len(self.books_all))
+        if self._fill_after_id:
+            self.after_cancel(self._fill_after_id)
+            self._fill_after_id = None
         self._clear_tree()
-        for i, b in enumerate(items):
-            tag = "odd" if i % 2 else "even"
-            self.tree.insert(
-                "", "end",
-                values=(b["title"], b["author"], b["publisher"], b["month"], b["day"], b["year"]),
-                tags=(tag,)
-            )
-        self._apply_tree_stripes()
-        self.status_var.set(f"Showing {len(items)} result(s).")
+        self._fill_indices = indices
+        self._fill_pos = 0
+        self._insert_chunk(self._FIRST_FILL)
+        if self._fill_pos < len(indices):
+            self._fill_after_id = self.after(1, self._continue_fill)
+        self.status_var.set(f"Showing {len(indices)} result(s).")
+
+    def _insert_chunk(self, count):
+        # Detach the tree while bulk-inserting so ttk skips per-row layout,
+        # and set the final stripe tag on insert (no second re-tag pass).
+        indices = self._fill_indices
+        row_tuples = self.row_tuples
+        insert = self.tree.insert
+        n = self._fill_pos
+        end = min(n + count, len(indices))
+        self.tree.grid_remove()
+        try:
+            while n < end:
+                insert("", "end", values=row_tuples[indices[n]], tags=("odd" if n % 2 else "even",))
+                n += 1
+        finally:
+            self.tree.grid()
+        self._fill_pos = n
+
+    def _continue_fill(self):
+        self._fill_after_id = None
+        if self._fill_pos < len(self._fill_indices):
+            self._insert_chunk(self._FILL_CHUNK)
+            if self._fill_pos < len(self._fill_indices):
+                self._fill_after_id = self.after(1, self._continue_fill)
+
+    def _on_tree_yscroll(self, first, last):
+        # Scrollbar feedback doubles as a demand signal: if the user nears
+        # the bottom while rows are still pending, pull the next chunk in now.
+        if self._fill_pos < len(self._fill_indices) and float(last) > 0.9:
+            self._insert_chunk(self._FILL_CHUNK)
+        self._vsb.set(first, last)
 
     def _validated_int(self, s, name):
         try:
@@ -475,19 +593,24 @@ class BestsellerApp(tk.Tk):
         return True
 
     def _sort_by(self, col, descending):
-        data = [(self.tree.set(k, col), k) for k in self.tree.get_children("")]
-        if col in ("month", "day", "year"):
-            try:
-                data = [(int(v), k) for v, k in data]
-            except Exception:
-                pass
-        data.sort(reverse=descending)
-        for index, (_, k) in enumerate(data):
-            self.tree.move(k, "", index)
+        # Sort the backing index list and repaint once. Sorting the widget
+        # itself cost a tree.set() read plus a tree.move() per row — 2N Tcl
+        # round-trips per header click. The int columns stay ints in
+        # row_tuples, so no str->int fixup is needed either.
+        pos = self._columns.index(col)
+        row_tuples = self.row_tuples
+        idx = self.filtered_idx
+        if idx is None:
+            idx = list(range(len(self.books_all)))
+        idx.sort(key=lambda i: row_tuples[i][pos], reverse=descending)
+        self._show_rows(idx)
         self.tree.heading(col, command=lambda c=col: self._sort_by(c, not descending))
 
     def export_csv(self):
-        if not getattr(self, "books_display", None):
+        indices = self.filtered_idx
+        if indices is None:
+            indices = range(len(self.books_all))
+        if not len(indices):
             messagebox.showinfo("No data", "There are no results to export.")
             return
         path = filedialog.asksaveasfilename(
@@ -497,43 +620,71 @@ class BestsellerApp(tk.Tk):
         )
         if not path:
             return
-        try:
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Title", "Author", "Publisher", "Month", "Day", "Year"])
-                for b in self.books_display:
-                    writer.writerow([
-                        b.get("title", ""),
-                        b.get("author", ""),
-                        b.get("publisher", ""),
-                        b.get("month", ""),
-                        b.get("day", ""),
-                        b.get("year", ""),
-                    ])
-            messagebox.showinfo("Export complete", f"Saved {len(self.books_display)} rows to:\n{path}")
-        except Exception as e:
-            messagebox.showerror("Export failed", str(e))
+
+        # Snapshot what the worker needs so a search run mid-export can't
+        # change the result set under it. row_tuples already holds each row
+        # in export column order, so no per-row formatting is left to do —
+        # writerows drains the prebuilt list in C. Completion dialogs are
+        # marshalled back via after().
+        row_tuples = self.row_tuples
+        rows = [row_tuples[i] for i in indices]
+
+        def _do_export():
+            try:
+                with open(path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(["Title", "Author", "Publisher", "Month", "Day", "Year"])
+                    writer.writerows(rows)
+            except Exception as e:
+                self.after(0, lambda err=e: messagebox.showerror("Export failed", str(err)))
+            else:
+                self.after(0, lambda: messagebox.showinfo(
+                    "Export complete", f"Saved {len(indices)} rows to:\n{path}"))
+
+        threading.Thread(target=_do_export, daemon=True).start()
+        self.status_var.set(f"Exporting {len(indices)} row(s)…")
 
     # ----- Event handlers -----
     def _on_live_search(self, _event=None):
-        q = self.live_q.get().strip().lower()
+        # Coalesce rapid keystrokes: only the last one in a ~130 ms burst
+        # actually filters and rebuilds the tree.
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(130, self._do_live_search)
+
+    def _do_live_search(self):
+        self._search_after_id = None
+        q = self.live_entry.get().strip().lower()
+        if self._filter_unchanged(("live", q)):
+            return
         if not q:
-            self.books_display = list(self.books_all)
-        else:
-            def matches(b):
-                return (q in b["title"].lower()
-                        or q in b["author"].lower()
-                        or q in b["publisher"].lower()
-                        or q in str(b["year"])
-                        or q in str(b["month"])
-                        or q in str(b["day"]))
-            self.books_display = [b for b in self.books_all if matches(b)]
-        self._refresh_tree(self.books_display)
+            self._show_rows(None)
+            return
+        # Keep the inner loop on locals only: one substring test per row,
+        # no attribute lookups.
+        haystacks = self.haystacks
+        self._show_rows([i for i, h in enumerate(haystacks) if q in h])
+
+    def _filter_unchanged(self, key):
+        # True (and no state change) when the same filter is re-submitted —
+        # button mashing, a re-typed identical query, modifier keystrokes.
+        if key == self._last_filter_key:
+            return True
+        self._last_filter_key = key
+        return False
+
+    def _show_rows(self, indices):
+        # Common tail of every search: remember the selection and repaint.
+        # indices is None for the unfiltered "show everything" state.
+        self.filtered_idx = indices
+        self._refresh_tree(indices)
 
     def clear_results(self):
-        self.live_q.set("")
-        self.books_display = list(self.books_all)
-        self._refresh_tree(self.books_display)
+        # Always repaints (it also covers "new file loaded"), so just reset
+        # the memo rather than consulting it.
+        self.live_entry.delete(0, "end")
+        self._last_filter_key = ("live", "")
+        self._show_rows(None)
 
     def _on_row_double_click(self, _evt):
         sel = self.tree.focus()
@@ -548,47 +699,50 @@ class BestsellerApp(tk.Tk):
 
     # ----- Searches -----
     def search_year_range(self):
-        s = self._validated_int(self.start_year.get().strip(), "Start year")
+        s = self._validated_int(self.start_year_entry.get().strip(), "Start year")
         if s is None or not self._validate_year(s):
             return
-        e = self._validated_int(self.end_year.get().strip(), "End year")
+        e = self._validated_int(self.end_year_entry.get().strip(), "End year")
         if e is None or not self._validate_year(e):
             return
         if s > e:
             s, e = e, s
-        results = [b for b in self.books_all if s <= b["year"] <= e]
-        self.books_display = results
-        self._refresh_tree(results)
+        if self._filter_unchanged(("years", s, e)):
+            return
+        idx = list(chain.from_iterable(self.by_year.get(y, ()) for y in range(s, e + 1)))
+        self._show_rows(idx)
 
     def search_month_year(self):
-        m = self._validated_int(self.month_val.get().strip(), "Month")
+        m = self._validated_int(self.month_entry.get().strip(), "Month")
         if m is None or not (1 <= m <= 12):
             messagebox.showwarning("Invalid month", "Month must be between 1 and 12.")
             return
-        y = self._validated_int(self.year_val.get().strip(), "Year")
+        y = self._validated_int(self.year_entry.get().strip(), "Year")
         if y is None or not self._validate_year(y):
             return
-        results = [b for b in self.books_all if b["month"] == m and b["year"] == y]
-        self.books_display = results
-        self._refresh_tree(results)
+        if self._filter_unchanged(("month_year", m, y)):
+            return
+        self._show_rows(list(self.by_year_month.get((y, m), ())))
 
     def search_author(self):
-        q = self.author_q.get().strip().lower()
+        q = self.author_entry.get().strip().lower()
         if not q:
             messagebox.showinfo("Input needed", "Please enter an author query.")
             return
-        results = [b for b in self.books_all if q in b["author"].lower()]
-        self.books_display = results
-        self._refresh_tree(results)
+        if self._filter_unchanged(("author", q)):
+            return
+        authors_lc = self.authors_lc
+        self._show_rows([i for i, a in enumerate(authors_lc) if q in a])
 
     def search_title(self):
-        q = self.title_q.get().strip().lower()
+        q = self.title_entry.get().strip().lower()
         if not q:
             messagebox.showinfo("Input needed", "Please enter a title query.")
             return
-        results = [b for b in self.books_all if q in b["title"].lower()]
-        self.books_display = results
-        self._refresh_tree(results)
+        if self._filter_unchanged(("title", q)):
+            return
+        titles_lc = self.titles_lc
+        self._show_rows([i for i, t in enumerate(titles_lc) if q in t])
 
 
 # ---------------------------